@@ -91,9 +91,10 @@ def setup_client():
         return client
     client = SimpleRealtime(event_loop=st.session_state.event_loop, audio_buffer_cb=audio_buffer_cb, debug=True)
 
-    # Add the time function tool
+    # Add the time function tool; it ignores its arguments so it can be prefetched
     client.add_tool(
-        get_current_time
+        get_current_time,
+        prefetch=True
     )
 
     return client
@@ -140,6 +141,19 @@ def response_area():
     st.write(st.session_state.client.transcript)
 
 
+@st.fragment(run_every=1)
+def metrics_area():
+    client = st.session_state.client
+    if not client.metrics:
+        return
+
+    st.markdown("**function call metrics**")
+    for metric in list(client.metrics):
+        status = "prefetched" if metric["prefetched"] else "not prefetched"
+        st.write(f"{metric['name']} {status}, saved {metric['time_saved'] * 1000:.0f} ms")
+    st.write(f"total saved: {client.time_saved_total * 1000:.0f} ms")
+
+
 @st.fragment(run_every=1)
 def audio_player():
     if not st.session_state.audio_stream_started:
@@ -179,6 +193,8 @@ def st_app():
                     except Exception as e:
                         st.error(f"Error connecting to OpenAI Realtime API: {str(e)}")
 
+            metrics_area()
+
         st.session_state.show_full_events = st.checkbox("Show Full Event Payloads", value=False)
         with st.container(height=300, key="logs_container"):
             logs_text_area()
@@ -3,7 +3,9 @@ import base64
 import json
 import numpy as np
 import os
+import time
 import tzlocal
+from collections import deque
 from datetime import datetime
 from inspect import signature, Parameter
 from typing import Dict, Any, List, Optional
@@ -22,6 +24,9 @@ class SimpleRealtime:
         self._message_handler_task = None
         self.audio_buffer_cb = audio_buffer_cb
         self.tools = {}  # Added for tool support
+        self.function_calls = {}  # In-flight function calls keyed by call_id
+        self.metrics = deque(maxlen=20)  # Per-call timing for the most recent function calls
+        self.time_saved_total = 0.0  # Time saved by prefetching across all function calls
 
     def _function_to_schema(self, func: callable) -> Dict[str, Any]:
         """
@@ -67,12 +72,23 @@ class SimpleRealtime:
             }
         }
 
-    def add_tool(self, func_or_definition: Any, handler: Optional[callable] = None) -> bool:
+    def add_tool(self, func_or_definition: Any, handler: Optional[callable] = None,
+                 prefetch: Any = False) -> bool:
         """
         Add a tool that can be called by the assistant.
         Can be called with either:
         1. add_tool(function) - automatically generates schema from function
         2. add_tool(definition, handler) - manual schema definition and handler
+
+        prefetch lets the tool start before its arguments have finished streaming:
+        - True: the handler is run speculatively with empty arguments as soon as
+          the tool name is known, and the result is reused if the final
+          arguments are also empty. Only allowed for tools with no required
+          parameters. A synchronous handler cannot be stopped once started, so
+          on a mismatch it runs a second time on the final arguments; only use
+          this for handlers without side effects.
+        - callable: a warm-up hook called with no arguments as soon as the tool
+          name is known; the handler still runs on the final arguments
         """
         if handler is None:
             # Called with just a function - generate schema automatically
@@ -92,7 +108,12 @@ class SimpleRealtime:
         if name in self.tools:
             raise ValueError(f"Tool '{name}' already added")
 
-        self.tools[name] = {'definition': definition, 'handler': handler}
+        if prefetch is not True and prefetch is not False and not callable(prefetch):
+            raise ValueError(f"Tool '{name}' prefetch must be a bool or a function")
+        if prefetch is True and definition.get('parameters', {}).get('required'):
+            raise ValueError(f"Tool '{name}' has required parameters and cannot be prefetched")
+
+        self.tools[name] = {'definition': definition, 'handler': handler, 'prefetch': prefetch}
 
         # Update session with new tool if connected
         if self.is_connected():
@@ -107,12 +128,12 @@ class SimpleRealtime:
             })
         return True
 
-    def add_tools(self, functions: List[callable]) -> bool:
+    def add_tools(self, functions: List[callable], prefetch: Any = False) -> bool:
         """
         Add multiple functions as tools at once, automatically generating schemas.
         """
         for func in functions:
-            self.add_tool(func)
+            self.add_tool(func, prefetch=prefetch)
         return True
 
     def is_connected(self):
@@ -187,23 +208,129 @@ class SimpleRealtime:
             except asyncio.CancelledError:
                 pass
         self._message_handler_task = None
+        self.discard_function_calls()
         return True
 
+    @staticmethod
+    async def _run_handler(handler, arguments):
+        """Run a tool handler on the event loop"""
+        if asyncio.iscoroutinefunction(handler):
+            return await handler(arguments)
+        return handler(arguments)
+
+    def _start_prefetch(self, func, *args):
+        """Start prefetched work, running sync functions in a worker thread so they overlap streaming"""
+        if asyncio.iscoroutinefunction(func):
+            return self.event_loop.create_task(func(*args))
+        return self.event_loop.create_task(asyncio.to_thread(func, *args))
+
+    @staticmethod
+    def _discard_prefetch(call):
+        """Cancel prefetched work that will not be used, retrieving any error it raised"""
+        task = call['task'] if call else None
+        if task is None:
+            return
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()
+
+    def discard_function_calls(self):
+        """Drop function calls whose arguments will never complete, e.g. after an interrupted response"""
+        for call in self.function_calls.values():
+            self._discard_prefetch(call)
+        self.function_calls = {}
+
+    def handle_function_call_started(self, event):
+        """Start tracking a function call as soon as the tool name is known"""
+        item = event.get('item', {})
+        if item.get('type') != 'function_call':
+            return
+
+        call_id = item.get('call_id')
+        name = item.get('name')
+        call = {
+            'name': name,
+            'arguments': item.get('arguments', ''),
+            'started_at': time.monotonic(),
+            'task': None,
+            'task_arguments': None,
+        }
+        self.function_calls[call_id] = call
+
+        tool = self.tools.get(name)
+        if not tool or not tool['prefetch']:
+            return
+
+        if tool['prefetch'] is True:
+            call['task_arguments'] = {}
+            call['task'] = self._start_prefetch(tool['handler'], {})
+        else:
+            call['task'] = self._start_prefetch(tool['prefetch'])
+        call['task'].add_done_callback(lambda _: call.setdefault('finished_at', time.monotonic()))
+
+    def handle_function_call_delta(self, event):
+        """Accumulate streamed function call arguments"""
+        call = self.function_calls.get(event.get('call_id'))
+        if call:
+            call['arguments'] += event.get('delta', '')
+
+    async def _resolve_function_call(self, call, tool, arguments):
+        """
+        Reconcile any prefetched work against the final arguments and return the
+        tool result, the time saved by starting early and whether the prefetched
+        work was actually used.
+        """
+        done_at = time.monotonic()
+        task = call['task'] if call else None
+
+        if task is None:
+            return await self._run_handler(tool['handler'], arguments), 0.0, False
+
+        warm_up = call['task_arguments'] is None
+        if not warm_up and call['task_arguments'] != arguments:
+            # Speculative result does not match the final arguments
+            self._discard_prefetch(call)
+            return await self._run_handler(tool['handler'], arguments), 0.0, False
+
+        try:
+            result = await task
+        except Exception as e:
+            print(f"Error prefetching tool {call['name']}: {e}")
+            return await self._run_handler(tool['handler'], arguments), 0.0, False
+        saved = min(call.get('finished_at', done_at), done_at) - call['started_at']
+
+        if warm_up:
+            # Warm-up hook finished, now run the handler for real
+            result = await self._run_handler(tool['handler'], arguments)
+        return result, saved, True
+
     async def handle_function_call(self, event):
         """Handle function calls from the assistant"""
+        call_id = event.get('call_id')
+        call = self.function_calls.pop(call_id, None)
         try:
-            name = event.get('name')
+            name = event.get('name') or (call['name'] if call else None)
             if name not in self.tools:
                 print(f"Unknown tool: {name}")
+                self._discard_prefetch(call)
                 return
 
-            call_id = event.get('call_id')
-            arguments = json.loads(event.get('arguments', '{}'))
+            raw_arguments = event.get('arguments')
+            if raw_arguments is None:
+                raw_arguments = call['arguments'] if call else ''
+            arguments = json.loads(raw_arguments or '{}')
             tool = self.tools[name]
 
-            # Execute the function
-            result = await tool['handler'](arguments) if asyncio.iscoroutinefunction(tool['handler']) else tool[
-                'handler'](arguments)
+            # Execute the function, reusing any prefetched work
+            result, time_saved, prefetched = await self._resolve_function_call(call, tool, arguments)
+            self.metrics.append({
+                'call_id': call_id,
+                'name': name,
+                'prefetched': prefetched,
+                'time_saved': time_saved,
+            })
+            self.time_saved_total += time_saved
 
             # Send function output back
             await self.ws.send(json.dumps({
@@ -222,6 +349,7 @@ class SimpleRealtime:
 
         except Exception as e:
             print(f"Error handling function call: {e}")
+            self._discard_prefetch(call)
             if call_id:
                 # Send error as function output
                 await self.ws.send(json.dumps({
@@ -249,9 +377,19 @@ class SimpleRealtime:
         event_type = event.get("type", "")
 
         # Handle function calls
-        if event_type == "response.function_call_arguments.done":
+        if event_type == "response.output_item.added":
+            self.handle_function_call_started(event)
+
+        elif event_type == "response.function_call_arguments.delta":
+            self.handle_function_call_delta(event)
+
+        elif event_type == "response.function_call_arguments.done":
             await self.handle_function_call(event)
 
+        # Calls still open when the response ends (e.g. it was interrupted) will never complete
+        elif event_type == "response.done":
+            self.discard_function_calls()
+
         # Handle audio responses
         elif "response.audio" in event_type:
             self.handle_audio(event)
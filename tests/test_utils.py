@@ -0,0 +1,138 @@
+import asyncio
+import json
+
+import pytest
+
+from openai_realtime_streamlit.utils import SimpleRealtime
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    def outputs(self):
+        return {
+            event["item"]["call_id"]: json.loads(event["item"]["output"])
+            for event in self.sent
+            if event["type"] == "conversation.item.create"
+        }
+
+
+def lookup(args=None):
+    """Look something up"""
+    lookup.calls.append(args)
+    return {"args": args}
+
+
+def needs_query(query: str):
+    """Needs a query"""
+    return query
+
+
+def failing_warm_up():
+    raise RuntimeError("warm-up failed")
+
+
+@pytest.fixture(autouse=True)
+def reset_lookup_calls():
+    lookup.calls = []
+
+
+async def stream_call(client, call_id, name, arguments, include_name=True):
+    await client.receive({
+        "type": "response.output_item.added",
+        "item": {"type": "function_call", "call_id": call_id, "name": name, "arguments": ""},
+    })
+    for char in arguments:
+        await client.receive({"type": "response.function_call_arguments.delta", "call_id": call_id, "delta": char})
+    # Give the prefetch task a chance to finish before the arguments are done
+    await asyncio.sleep(0.01)
+    done = {"type": "response.function_call_arguments.done", "call_id": call_id, "arguments": arguments}
+    if include_name:
+        done["name"] = name
+    await client.receive(done)
+
+
+def run_with_client(scenario, prefetch=True):
+    async def main():
+        client = SimpleRealtime(event_loop=asyncio.get_running_loop())
+        client.add_tool(lookup, prefetch=prefetch)
+        client.ws = FakeWebSocket()
+        await scenario(client)
+        return client
+
+    return asyncio.run(main())
+
+
+def test_matching_prefetch_is_reused():
+    client = run_with_client(lambda client: stream_call(client, "c1", "lookup", "{}"))
+
+    assert lookup.calls == [{}]
+    assert client.ws.outputs() == {"c1": {"args": {}}}
+    [metric] = client.metrics
+    assert metric["prefetched"] is True
+    assert metric["time_saved"] > 0
+    assert client.time_saved_total == metric["time_saved"]
+    assert client.function_calls == {}
+
+
+def test_mismatched_prefetch_reruns_handler():
+    client = run_with_client(lambda client: stream_call(client, "c1", "lookup", '{"q": 1}'))
+
+    assert lookup.calls == [{}, {"q": 1}]
+    assert client.ws.outputs() == {"c1": {"args": {"q": 1}}}
+    [metric] = client.metrics
+    assert metric["prefetched"] is False
+    assert metric["time_saved"] == 0.0
+
+
+def test_failed_warm_up_is_not_counted_as_prefetched():
+    client = run_with_client(lambda client: stream_call(client, "c1", "lookup", "{}"), prefetch=failing_warm_up)
+
+    assert lookup.calls == [{}]
+    assert client.ws.outputs() == {"c1": {"args": {}}}
+    [metric] = client.metrics
+    assert metric["prefetched"] is False
+    assert metric["time_saved"] == 0.0
+
+
+def test_done_event_without_name_uses_tracked_name():
+    client = run_with_client(lambda client: stream_call(client, "c1", "lookup", "{}", include_name=False))
+
+    assert client.ws.outputs() == {"c1": {"args": {}}}
+    assert client.metrics[0]["name"] == "lookup"
+
+
+def test_unknown_tool_is_dropped():
+    client = run_with_client(lambda client: stream_call(client, "c1", "missing", "{}"))
+
+    assert client.ws.sent == []
+    assert client.function_calls == {}
+
+
+def test_cancelled_response_discards_open_calls():
+    async def scenario(client):
+        await client.receive({
+            "type": "response.output_item.added",
+            "item": {"type": "function_call", "call_id": "c2", "name": "lookup", "arguments": ""},
+        })
+        task = client.function_calls["c2"]["task"]
+        await client.receive({"type": "response.done", "response": {"status": "cancelled"}})
+        assert client.function_calls == {}
+        await asyncio.sleep(0)
+        assert task.done()
+
+    client = run_with_client(scenario)
+
+    assert client.ws.sent == []
+    assert len(client.metrics) == 0
+
+
+def test_prefetch_requires_no_required_parameters():
+    client = SimpleRealtime()
+
+    with pytest.raises(ValueError):
+        client.add_tool(needs_query, prefetch=True)